@@ -5,6 +5,8 @@ DAuth applies the credential inside the enclave — tool code never handles
 raw secrets.
 """
 
+import asyncio
+import time
 from typing import Any
 from urllib.parse import urlencode
 
@@ -35,14 +37,67 @@ async def api_request(
         req = HttpRequest(method=method, path=path)
     resp = await ctx.dispatch(mercury_connection, req)
     if resp.success and resp.response is not None:
-        body = resp.response.body
-        if isinstance(body, dict):
-            return {"success": True, "data": body}
-        return {"success": True, "data": body}
+        return {"success": True, "data": resp.response.body}
+    # Prefix the HTTP status when we have one so callers (and the LLM) can
+    # tell a 429 rate limit from a hard failure.
     error = resp.error.message if resp.error else "Request failed"
+    status = getattr(resp.response, "status", None) if resp.response else None
+    if status is not None:
+        error = f"HTTP {status}: {error}"
     return {"success": False, "error": error}
 
 
+# --- Mercury API paths ---
+
+_ACCOUNTS_PATH = "/accounts"
+_COUNTERPARTIES_PATH = "/counterparties"
+_TRANSACTIONS_PATH = "/transactions"
+
+
+# --- TTL cache for rarely-changing listings ---
+#
+# One warm stateless process can serve multiple callers, and DAuth applies
+# each caller's own Mercury credential inside the enclave — so cached
+# listings are keyed by caller identity and never shared across callers.
+
+_CACHE_TTL_SECONDS = 60.0
+_cache: dict[str, tuple[float, dict]] = {}
+
+
+def _caller_cache_key(endpoint: str) -> str | None:
+    """Cache key scoped to the calling identity, or None to skip caching.
+
+    If the dispatch context exposes no caller identity we cannot prove two
+    requests belong to the same caller, so we don't cache at all.
+    """
+    ctx = get_context()
+    for attr in ("caller_id", "session_id", "client_id"):
+        ident = getattr(ctx, attr, None)
+        if ident:
+            return f"{endpoint}:{ident}"
+    return None
+
+
+def _cache_get(key: str) -> dict | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if time.monotonic() >= expires_at:
+        del _cache[key]
+        return None
+    return value
+
+
+def _cache_put(key: str, value: dict) -> None:
+    _cache[key] = (time.monotonic() + _CACHE_TTL_SECONDS, value)
+
+
+def invalidate_cache() -> None:
+    """Drop cached listings so the next call hits the Mercury API again."""
+    _cache.clear()
+
+
 # --- Result Model (flat dict to avoid $ref schema issues) ---
 
 
@@ -53,20 +108,38 @@ class MercuryResult(BaseModel):
 
 
 # --- Tools ---
+#
+# Each tool is appended to `tools` at definition time by _collect, so the
+# exported list can never drift out of sync with the decorated functions.
+
+tools: list = []
 
 
+def _collect(tool_func):
+    tools.append(tool_func)
+    return tool_func
+
+
+@_collect
 @tool(description="Get all accounts associated with the Mercury account")
 async def get_accounts() -> MercuryResult:
-    result = await api_request(HttpMethod.GET, "/accounts")
-    return MercuryResult(**result)
+    key = _caller_cache_key("accounts")
+    cached = _cache_get(key) if key else None
+    if cached is None:
+        cached = await api_request(HttpMethod.GET, _ACCOUNTS_PATH)
+        if key and cached["success"]:
+            _cache_put(key, cached)
+    return MercuryResult.model_validate(cached)
 
 
+@_collect
 @tool(description="Get a specific account by ID")
 async def get_account(account_id: str) -> MercuryResult:
     result = await api_request(HttpMethod.GET, f"/account/{account_id}")
-    return MercuryResult(**result)
+    return MercuryResult.model_validate(result)
 
 
+@_collect
 @tool(description="Get transactions for a specific account")
 async def get_transactions(
     account_id: str,
@@ -83,9 +156,97 @@ async def get_transactions(
         f"/account/{account_id}/transactions",
         params=params if params else None,
     )
-    return MercuryResult(**result)
+    return MercuryResult.model_validate(result)
+
+
+@_collect
+@tool(description="Get transactions for multiple accounts concurrently")
+async def get_all_transactions(
+    account_ids: list[str],
+    limit: int | None = None,
+) -> MercuryResult:
+    # Fan out one request per account; the semaphore keeps us under
+    # Mercury's rate limit.
+    semaphore = asyncio.Semaphore(10)
+
+    async def fetch(account_id: str) -> dict:
+        async with semaphore:
+            return await api_request(
+                HttpMethod.GET,
+                f"/account/{account_id}/transactions",
+                params={"limit": limit} if limit is not None else None,
+            )
+
+    results = await asyncio.gather(*(fetch(aid) for aid in account_ids))
+    data = dict(zip(account_ids, results))
+    errors = [f"{aid}: {r['error']}" for aid, r in data.items() if not r["success"]]
+    return MercuryResult(
+        success=not errors,
+        data=data,
+        error="; ".join(errors) if errors else None,
+    )
+
+
+# Upper bound on pages per bulk call: every page coroutine is created up
+# front, so an unbounded total could exhaust memory and hammer the API.
+_MAX_BULK_PAGES = 256
+
+
+@_collect
+@tool(description="Fetch a large transaction history by pulling pages concurrently")
+async def get_transactions_bulk(
+    account_id: str,
+    total: int,
+    page_size: int = 100,
+) -> MercuryResult:
+    if total <= 0 or page_size <= 0:
+        return MercuryResult(
+            success=False,
+            error="total and page_size must be positive",
+        )
+    pages_needed = -(-total // page_size)
+    if pages_needed > _MAX_BULK_PAGES:
+        return MercuryResult(
+            success=False,
+            error=(
+                f"total={total} with page_size={page_size} needs "
+                f"{pages_needed} pages; at most {_MAX_BULK_PAGES} pages "
+                "per call"
+            ),
+        )
+
+    # Pages are independent offset ranges, so fetch them concurrently and
+    # stitch the results back together in offset order. The last page is
+    # clamped so we never fetch more than the requested total.
+    semaphore = asyncio.Semaphore(8)
 
+    async def fetch_page(offset: int) -> dict:
+        async with semaphore:
+            return await api_request(
+                HttpMethod.GET,
+                f"/account/{account_id}/transactions",
+                params={"limit": min(page_size, total - offset), "offset": offset},
+            )
 
+    offsets = range(0, total, page_size)
+    pages = await asyncio.gather(*(fetch_page(o) for o in offsets))
+    errors = [
+        f"offset {o}: {p['error']}"
+        for o, p in zip(offsets, pages)
+        if not p["success"]
+    ]
+    if errors:
+        return MercuryResult(success=False, error="; ".join(errors))
+    transactions: list[dict[str, Any]] = []
+    for page in pages:
+        data = page["data"]
+        transactions.extend(
+            data.get("transactions", []) if isinstance(data, dict) else data
+        )
+    return MercuryResult(success=True, data={"transactions": transactions})
+
+
+@_collect
 @tool(description="Create a payment entry template that requires admin approval")
 async def create_payment_entry_template(
     account_id: str,
@@ -95,34 +256,86 @@ async def create_payment_entry_template(
     memo: str | None = None,
     external_id: str | None = None,
 ) -> MercuryResult:
+    # counterparty_id wins over counterparty_name; unset optionals are
+    # dropped so the API never sees empty fields.
     payload: dict[str, Any] = {
-        "account_id": account_id,
-        "amount": amount,
-        "requires_approval": True,
+        k: v
+        for k, v in (
+            ("account_id", account_id),
+            ("amount", amount),
+            ("requires_approval", True),
+            ("counterparty_id", counterparty_id or None),
+            ("counterparty_name", (counterparty_name or None) if not counterparty_id else None),
+            ("memo", memo or None),
+            ("external_id", external_id or None),
+        )
+        if v is not None
     }
-    if counterparty_id:
-        payload["counterparty_id"] = counterparty_id
-    elif counterparty_name:
-        payload["counterparty_name"] = counterparty_name
-    if memo:
-        payload["memo"] = memo
-    if external_id:
-        payload["external_id"] = external_id
-
-    result = await api_request(HttpMethod.POST, "/transactions", json_body=payload)
-    return MercuryResult(**result)
+    result = await api_request(HttpMethod.POST, _TRANSACTIONS_PATH, json_body=payload)
+    return MercuryResult.model_validate(result)
 
 
+@_collect
 @tool(description="Get all counterparties associated with the account")
 async def get_counterparties() -> MercuryResult:
-    result = await api_request(HttpMethod.GET, "/counterparties")
-    return MercuryResult(**result)
+    key = _caller_cache_key("counterparties")
+    cached = _cache_get(key) if key else None
+    if cached is None:
+        cached = await api_request(HttpMethod.GET, _COUNTERPARTIES_PATH)
+        if key and cached["success"]:
+            _cache_put(key, cached)
+    return MercuryResult.model_validate(cached)
+
+
+# --- Batching ---
+
+_BATCHABLE_TOOLS = {
+    "get_accounts": get_accounts,
+    "get_account": get_account,
+    "get_transactions": get_transactions,
+    "get_all_transactions": get_all_transactions,
+    "get_transactions_bulk": get_transactions_bulk,
+    "create_payment_entry_template": create_payment_entry_template,
+    "get_counterparties": get_counterparties,
+}
 
 
-tools = [
-    get_accounts,
-    get_account,
-    get_transactions,
-    create_payment_entry_template,
-    get_counterparties,
-]
+@_collect
+@tool(
+    description=(
+        "Run several Mercury tool calls concurrently in one request. Each call "
+        'is {"tool": <tool name>, "args": {...}}; results come back in the '
+        "same order."
+    )
+)
+async def batch_mercury(calls: list[dict[str, Any]]) -> MercuryResult:
+    # Sub-calls are flat dicts rather than a nested model to keep the tool
+    # schema $ref-free, matching MercuryResult.
+    semaphore = asyncio.Semaphore(10)
+
+    async def run(call: dict[str, Any]) -> dict:
+        name = call.get("tool")
+        tool_func = _BATCHABLE_TOOLS.get(name)
+        if tool_func is None:
+            return {"success": False, "error": f"Unknown tool: {name!r}"}
+        async with semaphore:
+            # Catch everything: a raising sub-call must become a per-call
+            # error, not abort the whole gather.
+            try:
+                result = await tool_func(**(call.get("args") or {}))
+            except Exception as e:
+                return {"success": False, "error": f"{name}: {e}"}
+        return result.model_dump()
+
+    results = await asyncio.gather(*(run(call) for call in calls))
+    errors = [
+        f"call {i}: {r['error']}"
+        for i, r in enumerate(results)
+        if not r["success"]
+    ]
+    return MercuryResult(
+        success=not errors,
+        data=list(results),
+        error="; ".join(errors) if errors else None,
+    )
+